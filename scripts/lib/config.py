@@ -1,9 +1,31 @@
 """
 Configuration management for michi-mem.
 """
+import copy
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
 
 
 class ConfigError(Exception):
@@ -22,37 +44,66 @@ class MemConfig:
         }
     }
 
-    def __init__(self, config_path: Path | str | None = None):
+    # Parsed config per path as (mtime_ns, data), shared across instances
+    _cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, config_path: Path | str | None = None, lazy: bool = False):
         """
         Initialize configuration.
 
         Args:
             config_path: Path to config file. If None, uses ~/.michi-mem/config.json
+            lazy: If True, defer loading, file creation and validation until
+                the first get() call
         """
         if config_path is None:
             config_path = Path.home() / ".michi-mem" / "config.json"
         self.config_path = Path(config_path)
-        self._data = self._load()
+        self._data = None
+        if not lazy:
+            self._data = self._load()
 
     def _load(self) -> Dict[str, Any]:
         """Load configuration from file or create defaults."""
         if not self.config_path.exists():
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            self._save(self.DEFAULTS)
-            return self.DEFAULTS.copy()
-
-        user_config = json.loads(self.config_path.read_text())
+            defaults = self._fresh_defaults()
+            self._save(defaults)
+            return defaults
+
+        key = str(self.config_path)
+        mtime = os.stat(self.config_path).st_mtime_ns
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return copy.deepcopy(cached[1])
+
+        user_config = _loads(self.config_path.read_bytes())
         merged_config = self._merge_with_defaults(user_config)
         self._validate(merged_config)
+
+        with self._cache_lock:
+            self._cache[key] = (mtime, copy.deepcopy(merged_config))
         return merged_config
 
     def _save(self, data: Dict[str, Any]) -> None:
         """Write configuration to file."""
-        self.config_path.write_text(json.dumps(data, indent=2))
+        self.config_path.write_bytes(_dumps(data))
+
+    def _fresh_defaults(self) -> Dict[str, Any]:
+        """Build a copy of DEFAULTS that shares no nested dicts with it."""
+        return {
+            **self.DEFAULTS,
+            "plugins": {
+                name: {**options}
+                for name, options in self.DEFAULTS["plugins"].items()
+            },
+        }
 
     def _merge_with_defaults(self, user_config: Dict[str, Any]) -> Dict[str, Any]:
         """Merge user configuration with defaults."""
-        merged = self.DEFAULTS.copy()
+        merged = self._fresh_defaults()
 
         for key, value in user_config.items():
             if key == "plugins" and isinstance(value, dict):
@@ -81,4 +132,6 @@ class MemConfig:
         Returns:
             Configuration value or default
         """
+        if self._data is None:
+            self._data = self._load()
         return self._data.get(key, default)
@@ -1,6 +1,28 @@
+import errno
 import os
+import time
+import uuid
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+
+
+# Content keys rendered as bulleted sections, in output order
+_LIST_SECTIONS = (
+    ("work_done", "Work Done"),
+    ("decisions", "Decisions Made"),
+    ("preferences", "Preferences Learned"),
+)
+
+# Errors meaning O_TMPFILE or linking it via /proc is unavailable here
+_TMPFILE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOENT, errno.EOPNOTSUPP, errno.EISDIR}
+)
+
+# Errors meaning the filesystem cannot create hard links
+_HARDLINK_UNSUPPORTED = frozenset({errno.EPERM, errno.EOPNOTSUPP, errno.ENOTSUP})
+
+# Upper bound on session-number collisions retried by create_entry
+_MAX_CREATE_ATTEMPTS = 100
 
 
 class DiaryWriter:
@@ -11,10 +33,19 @@ class DiaryWriter:
         Initialize the diary writer.
 
         Args:
-            diary_dir: Directory where diary entries will be stored
+            diary_dir: Directory where diary entries will be stored; it is
+                created on the first create_entry() call
         """
         self.diary_dir = Path(diary_dir)
-        self.diary_dir.mkdir(parents=True, exist_ok=True)
+        self.diary_dir_str = os.fspath(self.diary_dir)
+        self._mkdir_done = False
+        self._last_session = {}
+        self._date_cache = (None, 0.0)
+        # Linux only; switched off after the first unsupported attempt
+        self._use_tmpfile = hasattr(os, "O_TMPFILE")
+        self._dir_fd = None
+        # Switched off when the filesystem does not support hard links
+        self._use_hardlink = True
 
     def create_entry(self, content):
         """
@@ -32,26 +63,142 @@ class DiaryWriter:
         Returns:
             Path to the created diary entry file
         """
-        today = datetime.now().strftime("%Y-%m-%d")
-        session_number = self._get_next_session_number(today)
+        if not self._mkdir_done:
+            self.diary_dir.mkdir(parents=True, exist_ok=True)
+            self._mkdir_done = True
+
+        today = self._today()
+        for _ in range(_MAX_CREATE_ATTEMPTS):
+            session_number = self._get_next_session_number(today)
+            filename = f"{today}_session_{session_number:03d}.md"
+            entry_path = os.path.join(self.diary_dir_str, filename)
+            try:
+                self._write_exclusive(entry_path, content, today, session_number)
+            except FileExistsError:
+                # Another writer took this session number; re-read the
+                # counter from disk and try the next free one.
+                del self._last_session[today]
+                continue
+            return entry_path
 
-        entry_content = self._format_entry(content, today, session_number)
+        raise FileExistsError(
+            f"No free session number for {today} after {_MAX_CREATE_ATTEMPTS} attempts"
+        )
+
+    def _write_exclusive(self, entry_path, content, date, session):
+        """
+        Atomically create a diary entry, never replacing an existing file.
+
+        Args:
+            entry_path: Final path of the diary entry
+            content: Dictionary containing entry data
+            date: Date string in YYYY-MM-DD format
+            session: Session number
 
-        filename = f"{today}_session_{session_number:03d}.md"
-        entry_path = self.diary_dir / filename
+        Raises:
+            FileExistsError: If entry_path already exists
+        """
+        if self._use_tmpfile and self._link_tmpfile(entry_path, content, date, session):
+            return
 
-        # Atomic write: write to temp file, then rename
-        temp_path = self.diary_dir / f"{filename}.tmp"
+        # Atomic write: write to a private temp file, then link it into
+        # place (link fails instead of overwriting) and drop the temp name
+        temp_path = f"{entry_path}.{uuid.uuid4().hex}.tmp"
         try:
-            with open(temp_path, "w") as f:
-                f.write(entry_content)
-            os.rename(temp_path, entry_path)
+            with open(temp_path, "x", buffering=65536) as f:
+                self._write_entry(f, content, date, session)
+            if self._use_hardlink:
+                try:
+                    os.link(temp_path, entry_path)
+                    return
+                except OSError as e:
+                    if e.errno not in _HARDLINK_UNSUPPORTED:
+                        raise
+                    self._use_hardlink = False
+
+            # No hard links on this filesystem: reserve the name exclusively,
+            # then rename the temp file over the empty placeholder
+            os.close(os.open(entry_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+            try:
+                os.replace(temp_path, entry_path)
+            except OSError:
+                os.unlink(entry_path)
+                raise
         finally:
-            # Clean up temp file if it still exists
-            if temp_path.exists():
-                temp_path.unlink()
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+
+    def _link_tmpfile(self, entry_path, content, date, session):
+        """
+        Write the entry to an anonymous O_TMPFILE and link it into place.
 
-        return str(entry_path)
+        The file has no name until it is linked, so a crash never leaves a
+        partial entry or stray temp file behind.
+
+        Args:
+            entry_path: Final path of the diary entry
+            content: Dictionary containing entry data
+            date: Date string in YYYY-MM-DD format
+            session: Session number
+
+        Returns:
+            True if the entry was written, False if the caller should fall
+            back to the temp-file-and-link path
+        """
+        try:
+            if self._dir_fd is None:
+                self._dir_fd = os.open(self.diary_dir_str, os.O_RDONLY | os.O_DIRECTORY)
+            fd = os.open(".", os.O_TMPFILE | os.O_WRONLY, 0o666, dir_fd=self._dir_fd)
+        except OSError as e:
+            if e.errno not in _TMPFILE_UNSUPPORTED:
+                raise
+            # Filesystem or kernel without O_TMPFILE support
+            self._use_tmpfile = False
+            return False
+
+        try:
+            with os.fdopen(fd, "w", buffering=65536, closefd=False) as f:
+                self._write_entry(f, content, date, session)
+            try:
+                # A dir_fd argument makes os.link use linkat(AT_SYMLINK_FOLLOW);
+                # plain link(2) won't follow the /proc fd link and fails
+                os.link(
+                    f"/proc/self/fd/{fd}",
+                    os.path.basename(entry_path),
+                    dst_dir_fd=self._dir_fd,
+                )
+            except OSError as e:
+                if e.errno not in _TMPFILE_UNSUPPORTED:
+                    raise
+                # No /proc, or this system refuses to link a file by fd
+                self._use_tmpfile = False
+                return False
+        finally:
+            os.close(fd)
+
+        return True
+
+    def __del__(self):
+        if getattr(self, "_dir_fd", None) is not None:
+            os.close(self._dir_fd)
+            self._dir_fd = None
+
+    def _today(self):
+        """
+        Get today's date, reusing the cached string until local midnight.
+
+        Returns:
+            Date string in YYYY-MM-DD format
+        """
+        today, expires_at = self._date_cache
+        if time.time() >= expires_at:
+            now = datetime.now()
+            midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+            today = now.strftime("%Y-%m-%d")
+            self._date_cache = (today, (midnight + timedelta(days=1)).timestamp())
+        return today
 
     def _get_next_session_number(self, date):
         """
@@ -63,62 +210,54 @@ class DiaryWriter:
         Returns:
             Next session number (starting from 1)
         """
-        existing_sessions = list(self.diary_dir.glob(f"{date}_session_*.md"))
-        return len(existing_sessions) + 1
+        if date not in self._last_session:
+            # Seed the counter from disk once per date; later calls on this
+            # writer only bump the in-memory value.
+            prefix = f"{date}_session_"
+            numbers = []
+            with os.scandir(self.diary_dir_str) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith(".md"):
+                        counter = name[len(prefix):-len(".md")]
+                        if counter.isdigit():
+                            numbers.append(int(counter))
+            self._last_session[date] = max(numbers, default=0)
 
-    def _format_entry(self, content, date, session):
+        self._last_session[date] += 1
+        return self._last_session[date]
+
+    def _write_entry(self, f, content, date, session):
         """
-        Format the diary entry as markdown.
+        Write the diary entry as markdown to an open file.
+
+        Sections are separated by a single blank line, empty sections are
+        omitted and trailing whitespace at the end of the entry is trimmed.
 
         Args:
+            f: Writable text file object
             content: Dictionary containing entry data
             date: Date string in YYYY-MM-DD format
             session: Session number
-
-        Returns:
-            Formatted markdown string
         """
-        lines = []
-
         # Metadata section
-        lines.append(f"Project: {content.get('project', 'N/A')}")
-        lines.append(f"Branch: {content.get('branch', 'N/A')}")
-        lines.append(f"Date: {date}")
-        lines.append(f"Session: {session:03d}")
-        lines.append("")
+        blocks = [
+            f"Project: {content.get('project', 'N/A')}\n"
+            f"Branch: {content.get('branch', 'N/A')}\n"
+            f"Date: {date}\n"
+            f"Session: {session:03d}\n"
+        ]
 
         # Summary section
         if content.get("summary"):
-            lines.append("## Summary")
-            lines.append("")
-            lines.append(content["summary"])
-            lines.append("")
-
-        # Work Done section
-        work_done = content.get("work_done", [])
-        if work_done:
-            lines.append("## Work Done")
-            lines.append("")
-            for item in work_done:
-                lines.append(f"- {item}")
-            lines.append("")
-
-        # Decisions Made section
-        decisions = content.get("decisions", [])
-        if decisions:
-            lines.append("## Decisions Made")
-            lines.append("")
-            for item in decisions:
-                lines.append(f"- {item}")
-            lines.append("")
-
-        # Preferences Learned section
-        preferences = content.get("preferences", [])
-        if preferences:
-            lines.append("## Preferences Learned")
-            lines.append("")
-            for item in preferences:
-                lines.append(f"- {item}")
-            lines.append("")
-
-        return "\n".join(lines).rstrip() + "\n"
+            blocks.append(f"\n## Summary\n\n{content['summary']}\n")
+
+        # Work Done, Decisions Made and Preferences Learned sections
+        for key, heading in _LIST_SECTIONS:
+            items = content.get(key, [])
+            if items:
+                blocks.append(f"\n## {heading}\n\n" + "".join(f"- {item}\n" for item in items))
+
+        # The entry ends with exactly one newline
+        blocks[-1] = blocks[-1].rstrip() + "\n"
+        f.writelines(blocks)
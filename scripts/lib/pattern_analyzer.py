@@ -1,39 +1,95 @@
 import os
 import re
+import sys
 from pathlib import Path
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Dict, Any
 
 
+_PATTERN_SECTIONS = ("Preferences Observed", "Decisions Made")
+# One pass over the file finds every pattern section and its bullet list.
+_SECTION_RE = re.compile(
+    rf"^## ({'|'.join(map(re.escape, _PATTERN_SECTIONS))})\s*\n((?:^- .+\n?)*)",
+    re.MULTILINE,
+)
+_ITEM_RE = re.compile(r"^- (.+)$", re.MULTILINE)
+
+# Below this many entries, pool startup costs more than it saves.
+_PARALLEL_THRESHOLD = 8
+_MAX_WORKERS = 8
+# Set to "1" to parse entries in worker processes instead of threads.
+_USE_PROCESSES_ENV = "MICHI_MEM_ANALYZE_PROCESSES"
+
+
 class PatternAnalyzer:
     def __init__(self, diary_dir: str, reflections_dir: str):
         self.diary_dir = Path(diary_dir)
         self.reflections_dir = Path(reflections_dir)
-        self.processed_log = self.reflections_dir / "processed.log"
+        self.diary_dir_str = os.fspath(self.diary_dir)
+        self.processed_log = os.path.join(os.fspath(self.reflections_dir), "processed.log")
+        self._processed_cache = None
+        self._processed_mtime = -1
+
+    def _load_processed(self) -> set:
+        try:
+            mtime = os.stat(self.processed_log).st_mtime_ns
+        except FileNotFoundError:
+            return set()
+
+        if self._processed_cache is None or mtime != self._processed_mtime:
+            with open(self.processed_log, 'r') as f:
+                lines = [line.strip() for line in f.read().splitlines()]
+            lines = [line for line in lines if line]
+            names = {os.path.basename(line) for line in lines}
 
-    def get_unprocessed_entries(self) -> List[str]:
-        processed_files = set()
+            # Older logs recorded full paths; rewrite them as basenames once.
+            if len(names) != len(lines) or not names.issuperset(lines):
+                temp_path = self.processed_log + ".tmp"
+                with open(temp_path, 'w') as f:
+                    f.write("".join(f"{name}\n" for name in sorted(names)))
+                os.replace(temp_path, self.processed_log)
+                mtime = os.stat(self.processed_log).st_mtime_ns
 
-        if self.processed_log.exists():
-            with open(self.processed_log, 'r') as f:
-                processed_files = set(line.strip() for line in f if line.strip())
+            self._processed_cache = names
+            self._processed_mtime = mtime
+
+        return self._processed_cache
+
+    def get_unprocessed_entries(self) -> List[str]:
+        processed_files = self._load_processed()
 
+        diary_dir = self.diary_dir_str
         all_entries = []
-        for entry in self.diary_dir.glob("*.md"):
-            entry_path = str(entry)
-            if entry_path not in processed_files:
-                all_entries.append(entry_path)
+        with os.scandir(diary_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(".") or not name.endswith(".md"):
+                    continue
+                if not entry.is_file():
+                    continue
+                if name not in processed_files:
+                    all_entries.append(os.path.join(diary_dir, name))
 
         return sorted(all_entries)
 
     def analyze(self, entries: List[str]) -> Dict[str, List[Dict[str, Any]]]:
-        all_patterns = []
-
-        for entry_path in entries:
-            patterns = self._parse_entry(entry_path)
-            all_patterns.extend(patterns)
-
-        pattern_counts = Counter(all_patterns)
+        pattern_counts = Counter()
+
+        if len(entries) > _PARALLEL_THRESHOLD:
+            if os.environ.get(_USE_PROCESSES_ENV) == "1":
+                executor_cls = ProcessPoolExecutor
+            else:
+                executor_cls = ThreadPoolExecutor
+            max_workers = min(_MAX_WORKERS, os.cpu_count() or 4)
+            # Thread pools ignore chunksize; process pools get one batch per worker
+            chunksize = max(1, len(entries) // max_workers)
+            with executor_cls(max_workers=max_workers) as executor:
+                for patterns in executor.map(self._parse_entry, entries, chunksize=chunksize):
+                    pattern_counts.update(patterns)
+        else:
+            for entry_path in entries:
+                pattern_counts.update(self._parse_entry(entry_path))
 
         strong = []
         moderate = []
@@ -60,24 +116,33 @@ class PatternAnalyzer:
             content = f.read()
 
         patterns = []
-        patterns.extend(self._extract_section(content, "Preferences Observed"))
-        patterns.extend(self._extract_section(content, "Decisions Made"))
+        seen = set()
+        for match in _SECTION_RE.finditer(content):
+            section_name = match.group(1)
+            if section_name in seen:
+                continue
+            seen.add(section_name)
+            patterns.extend(sys.intern(item) for item in _ITEM_RE.findall(match.group(2)))
+            if len(seen) == len(_PATTERN_SECTIONS):
+                break
 
         return patterns
 
-    def _extract_section(self, content: str, section_name: str) -> List[str]:
-        pattern = rf"^## {re.escape(section_name)}\s*\n((?:^- .+\n?)*)"
-        match = re.search(pattern, content, re.MULTILINE)
-
-        if not match:
-            return []
-
-        section_content = match.group(1)
-        items = re.findall(r"^- (.+)$", section_content, re.MULTILINE)
+    def mark_processed(self, entries: List[str]) -> None:
+        names = [os.path.basename(entry) for entry in entries]
 
-        return items
+        # Only extend the cache if nobody else touched the log since it was
+        # loaded; otherwise their lines would be missing from it.
+        try:
+            cache_is_current = os.stat(self.processed_log).st_mtime_ns == self._processed_mtime
+        except FileNotFoundError:
+            cache_is_current = False
+        if not cache_is_current:
+            self._processed_cache = None
 
-    def mark_processed(self, entries: List[str]) -> None:
         with open(self.processed_log, 'a') as f:
-            for entry in entries:
-                f.write(entry + "\n")
+            f.write("".join(f"{name}\n" for name in names))
+
+        if self._processed_cache is not None:
+            self._processed_cache.update(names)
+            self._processed_mtime = os.stat(self.processed_log).st_mtime_ns
@@ -2,8 +2,10 @@
 Tests for configuration module.
 """
 import json
+import os
 import pytest
 from pathlib import Path
+from scripts.lib import config as config_module
 from scripts.lib.config import MemConfig, ConfigError
 
 
@@ -81,3 +83,66 @@ def test_merges_with_defaults(tmp_path):
     assert config.get("retention_days") == 90
     assert config.get("min_turns") == 3
     assert config.get("plugins")["mem"]["enabled"] is True
+
+
+def test_reuses_parsed_config_until_file_changes(tmp_path, monkeypatch):
+    """Reuses the parsed config for an unchanged file and reloads on change."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"retention_days": 45}))
+
+    first = MemConfig(config_path=config_file)
+
+    def fail_loads(*args, **kwargs):
+        raise AssertionError("config should not be re-parsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(config_module, "_loads", fail_loads)
+        second = MemConfig(config_path=config_file)
+
+    assert second.get("retention_days") == 45
+    second.get("plugins")["mem"]["enabled"] = False
+    assert first.get("plugins")["mem"]["enabled"] is True
+
+    config_file.write_text(json.dumps({"retention_days": 60}))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert MemConfig(config_path=config_file).get("retention_days") == 60
+    cached_paths = [path for path in MemConfig._cache if path.startswith(str(tmp_path))]
+    assert cached_paths == [str(config_file)]
+    assert MemConfig._cache[str(config_file)][0] == config_file.stat().st_mtime_ns
+
+
+def test_does_not_share_defaults_between_instances(tmp_path):
+    """Mutating one instance's config leaves the class defaults untouched."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"retention_days": 90}))
+
+    config = MemConfig(config_path=config_file)
+    config.get("plugins")["mem"]["enabled"] = False
+
+    assert MemConfig.DEFAULTS["plugins"]["mem"]["enabled"] is True
+    fresh = MemConfig(config_path=tmp_path / "fresh.json")
+    assert fresh.get("plugins")["mem"]["enabled"] is True
+
+
+def test_lazy_config_defers_loading_until_get(tmp_path):
+    """Lazy configs touch the filesystem only on first access."""
+    config_file = tmp_path / "config.json"
+
+    config = MemConfig(config_path=config_file, lazy=True)
+    assert not config_file.exists()
+
+    assert config.get("retention_days") == 30
+    assert config_file.exists()
+
+
+def test_lazy_config_validates_on_first_get(tmp_path):
+    """Lazy configs still reject invalid values, on first access."""
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps({"min_turns": -1}))
+
+    config = MemConfig(config_path=config_file, lazy=True)
+
+    with pytest.raises(ConfigError, match="min_turns must be positive"):
+        config.get("min_turns")
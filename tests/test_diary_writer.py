@@ -1,4 +1,6 @@
+import errno
 import os
+import sys
 import json
 import tempfile
 import shutil
@@ -124,3 +126,186 @@ def test_atomic_write(temp_diary_dir, sample_content):
     diary_files = os.listdir(temp_diary_dir)
     tmp_files = [f for f in diary_files if f.endswith('.tmp')]
     assert len(tmp_files) == 0, "Temporary files should not be left behind"
+
+
+def test_continues_numbering_from_existing_entries(temp_diary_dir, sample_content):
+    """Test that a new writer picks up after sessions already on disk."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    Path(temp_diary_dir, f"{today}_session_001.md").write_text("existing\n")
+    Path(temp_diary_dir, f"{today}_session_004.md").write_text("existing\n")
+
+    writer = DiaryWriter(temp_diary_dir)
+    entry1 = writer.create_entry(sample_content)
+    entry2 = writer.create_entry(sample_content)
+
+    assert entry1.endswith(f"{today}_session_005.md")
+    assert entry2.endswith(f"{today}_session_006.md")
+
+
+def test_removes_temp_file_when_link_fails(temp_diary_dir, sample_content, monkeypatch):
+    """Test that a failed link does not leave a .tmp file behind."""
+    writer = DiaryWriter(temp_diary_dir)
+    writer._use_tmpfile = False
+
+    def failing_link(src, dst):
+        raise OSError("link failed")
+
+    monkeypatch.setattr(os, "link", failing_link)
+
+    with pytest.raises(OSError, match="link failed"):
+        writer.create_entry(sample_content)
+
+    assert os.listdir(temp_diary_dir) == []
+
+
+def test_refreshes_date_after_midnight(temp_diary_dir, sample_content):
+    """Test that the cached date is recomputed once it has expired."""
+    writer = DiaryWriter(temp_diary_dir)
+    writer.create_entry(sample_content)
+
+    writer._date_cache = ("1999-12-31", 0.0)
+    entry_path = writer.create_entry(sample_content)
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert os.path.basename(entry_path).startswith(today)
+
+
+def test_link_fallback_writes_same_entry(temp_diary_dir, sample_content):
+    """Test that the temp-file-and-link path produces the same entry."""
+    linked = DiaryWriter(os.path.join(temp_diary_dir, "linked"))
+    renamed = DiaryWriter(os.path.join(temp_diary_dir, "renamed"))
+    renamed._use_tmpfile = False
+
+    with open(linked.create_entry(sample_content)) as f:
+        linked_content = f.read()
+    if sys.platform.startswith("linux"):
+        assert linked._use_tmpfile, "O_TMPFILE path should be used on Linux"
+    elif not linked._use_tmpfile:
+        pytest.skip("O_TMPFILE linking is not supported on this system")
+    with open(renamed.create_entry(sample_content)) as f:
+        renamed_content = f.read()
+
+    assert linked_content == renamed_content
+    assert os.listdir(renamed.diary_dir_str) == os.listdir(linked.diary_dir_str)
+
+
+def test_creates_diary_dir_on_first_entry(temp_diary_dir, sample_content):
+    """Test that the diary directory is created lazily by create_entry."""
+    diary_dir = os.path.join(temp_diary_dir, "nested", "diary")
+    writer = DiaryWriter(diary_dir)
+    assert not os.path.exists(diary_dir)
+
+    entry_path = writer.create_entry(sample_content)
+
+    assert os.path.dirname(entry_path) == diary_dir
+    assert os.path.exists(entry_path)
+
+
+@pytest.mark.parametrize("use_tmpfile", [True, False])
+def test_concurrent_writers_do_not_overwrite(temp_diary_dir, use_tmpfile):
+    """Test that two writers on one directory never reuse a session number."""
+    writer_a = DiaryWriter(temp_diary_dir)
+    writer_b = DiaryWriter(temp_diary_dir)
+    writer_a._use_tmpfile = writer_a._use_tmpfile and use_tmpfile
+    writer_b._use_tmpfile = writer_b._use_tmpfile and use_tmpfile
+
+    entry1 = writer_a.create_entry({"summary": "A first"})
+    entry2 = writer_b.create_entry({"summary": "B first"})
+    entry3 = writer_a.create_entry({"summary": "A second"})
+
+    assert "_session_001.md" in entry1
+    assert "_session_002.md" in entry2
+    assert "_session_003.md" in entry3
+    with open(entry2) as f:
+        assert "B first" in f.read()
+    assert len([f for f in os.listdir(temp_diary_dir) if f.endswith(".md")]) == 3
+    assert not [f for f in os.listdir(temp_diary_dir) if f.endswith(".tmp")]
+
+
+def test_trims_trailing_whitespace_at_end_of_entry(temp_diary_dir):
+    """Test that the entry always ends with exactly one newline."""
+    writer = DiaryWriter(temp_diary_dir)
+
+    summary_last = writer.create_entry({"summary": "multi\nline\n\n"})
+    item_last = writer.create_entry({"summary": "s", "work_done": ["a\n", "x  "]})
+
+    with open(summary_last) as f:
+        assert f.read().endswith("## Summary\n\nmulti\nline\n")
+    with open(item_last) as f:
+        assert f.read().endswith("## Work Done\n\n- a\n\n- x\n")
+
+
+def test_tmpfile_write_errors_are_not_swallowed(temp_diary_dir, sample_content, monkeypatch):
+    """Test that real I/O errors on the O_TMPFILE path propagate."""
+    writer = DiaryWriter(temp_diary_dir)
+    if not writer._use_tmpfile:
+        pytest.skip("O_TMPFILE is not available on this platform")
+
+    def failing_write(self, f, content, date, session):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(DiaryWriter, "_write_entry", failing_write)
+
+    with pytest.raises(OSError) as excinfo:
+        writer.create_entry(sample_content)
+
+    assert excinfo.value.errno == errno.ENOSPC
+    assert writer._use_tmpfile is True
+    assert os.listdir(temp_diary_dir) == []
+
+
+def test_numbers_past_session_999(temp_diary_dir, sample_content):
+    """Test that four-digit session numbers are parsed when seeding."""
+    today = datetime.now().strftime("%Y-%m-%d")
+    Path(temp_diary_dir, f"{today}_session_999.md").write_text("existing\n")
+    Path(temp_diary_dir, f"{today}_session_1000.md").write_text("existing\n")
+
+    writer = DiaryWriter(temp_diary_dir)
+    entry_path = writer.create_entry(sample_content)
+
+    assert entry_path.endswith(f"{today}_session_1001.md")
+
+
+def test_gives_up_after_repeated_collisions(temp_diary_dir, sample_content, monkeypatch):
+    """Test that create_entry stops retrying instead of looping forever."""
+    writer = DiaryWriter(temp_diary_dir)
+    attempts = []
+
+    def always_taken(entry_path, content, date, session):
+        attempts.append(session)
+        raise FileExistsError(entry_path)
+
+    monkeypatch.setattr(writer, "_write_exclusive", always_taken)
+
+    with pytest.raises(FileExistsError, match="No free session number"):
+        writer.create_entry(sample_content)
+    assert len(attempts) == 100
+
+
+def test_falls_back_to_replace_without_hard_links(temp_diary_dir, sample_content, monkeypatch):
+    """Test that filesystems without hard links still get exclusive entries."""
+    writer_a = DiaryWriter(temp_diary_dir)
+    writer_b = DiaryWriter(temp_diary_dir)
+    writer_a._use_tmpfile = False
+    writer_b._use_tmpfile = False
+
+    def unsupported_link(src, dst, **kwargs):
+        raise OSError(errno.EPERM, "Operation not permitted")
+
+    monkeypatch.setattr(os, "link", unsupported_link)
+
+    entry1 = writer_a.create_entry({"summary": "A first"})
+    entry2 = writer_b.create_entry({"summary": "B first"})
+    entry3 = writer_a.create_entry({"summary": "A second"})
+
+    assert writer_a._use_hardlink is False
+    assert "_session_003.md" in entry3
+    with open(entry1) as f:
+        assert "A first" in f.read()
+    with open(entry2) as f:
+        assert "B first" in f.read()
+    with open(entry3) as f:
+        assert "A second" in f.read()
+    assert sorted(os.listdir(temp_diary_dir)) == sorted(
+        os.path.basename(p) for p in (entry1, entry2, entry3)
+    )
@@ -98,7 +98,6 @@ def test_detects_emerging_patterns(test_env):
 
 def test_marks_entries_as_processed(test_env):
     analyzer = test_env["analyzer"]
-    diary_dir = test_env["diary_dir"]
     reflections_dir = test_env["reflections_dir"]
 
     entries = analyzer.get_unprocessed_entries()
@@ -108,9 +107,150 @@ def test_marks_entries_as_processed(test_env):
     assert processed_log.exists()
 
     processed_content = processed_log.read_text()
-    assert str(diary_dir / "diary-1.md") in processed_content
-    assert str(diary_dir / "diary-2.md") in processed_content
-    assert str(diary_dir / "diary-3.md") in processed_content
+    assert processed_content.splitlines() == ["diary-1.md", "diary-2.md", "diary-3.md"]
 
     new_entries = analyzer.get_unprocessed_entries()
     assert len(new_entries) == 0
+
+
+def test_ignores_items_outside_pattern_sections(test_env):
+    analyzer = test_env["analyzer"]
+    diary_dir = test_env["diary_dir"]
+
+    entry = diary_dir / "diary-4.md"
+    entry.write_text(
+        "## Work Done\n"
+        "- Refactored parser\n"
+        "\n"
+        "## Decisions Made\n"
+        "- Stream diary files line by line\n"
+        "### Notes\n"
+        "- Not a decision\n"
+    )
+
+    patterns = analyzer._parse_entry(str(entry))
+
+    assert patterns == ["Stream diary files line by line"]
+
+
+def test_reloads_processed_log_when_modified(test_env):
+    analyzer = test_env["analyzer"]
+    diary_dir = test_env["diary_dir"]
+    reflections_dir = test_env["reflections_dir"]
+
+    entries = analyzer.get_unprocessed_entries()
+    analyzer.mark_processed(entries)
+    assert analyzer.get_unprocessed_entries() == []
+
+    processed_log = reflections_dir / "processed.log"
+    processed_log.write_text(str(diary_dir / "diary-1.md") + "\n")
+    stat = processed_log.stat()
+    os.utime(processed_log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    remaining = analyzer.get_unprocessed_entries()
+
+    assert len(remaining) == 2
+    assert all("diary-1.md" not in entry for entry in remaining)
+
+
+@pytest.mark.parametrize("use_processes", ["0", "1"])
+def test_parallel_analysis_matches_sequential(test_env, monkeypatch, use_processes):
+    analyzer = test_env["analyzer"]
+    diary_dir = test_env["diary_dir"]
+
+    fixtures_dir = Path(__file__).parent / "fixtures"
+    for i in range(4):
+        for fixture_file in ["diary-1.md", "diary-2.md", "diary-3.md"]:
+            dst = diary_dir / f"copy-{i}-{fixture_file}"
+            dst.write_text((fixtures_dir / fixture_file).read_text())
+
+    entries = analyzer.get_unprocessed_entries()
+    assert len(entries) == 15
+
+    monkeypatch.setenv("MICHI_MEM_ANALYZE_PROCESSES", use_processes)
+    results = analyzer.analyze(entries)
+
+    sequential = {}
+    for entry in entries:
+        for pattern in analyzer._parse_entry(entry):
+            sequential[pattern] = sequential.get(pattern, 0) + 1
+    counts = {
+        p["pattern"]: p["count"]
+        for tier in ("strong", "moderate", "emerging")
+        for p in results[tier]
+    }
+    assert counts == sequential
+    assert results["strong"][0] == {"pattern": "Prefer pytest over unittest", "count": 15}
+
+
+def test_migrates_full_paths_in_processed_log(test_env):
+    analyzer = test_env["analyzer"]
+    diary_dir = test_env["diary_dir"]
+    reflections_dir = test_env["reflections_dir"]
+
+    processed_log = reflections_dir / "processed.log"
+    processed_log.write_text(
+        str(diary_dir / "diary-1.md") + "\n" + str(diary_dir / "diary-2.md") + "\n"
+    )
+
+    entries = analyzer.get_unprocessed_entries()
+
+    assert entries == [str(diary_dir / "diary-3.md")]
+    assert processed_log.read_text().splitlines() == ["diary-1.md", "diary-2.md"]
+
+
+def test_reads_each_pattern_section_once(test_env):
+    analyzer = test_env["analyzer"]
+    diary_dir = test_env["diary_dir"]
+
+    entry = diary_dir / "diary-4.md"
+    entry.write_text(
+        "## Preferences Observed\n"
+        "- Prefer small commits\n"
+        "\n"
+        "## Preferences Observed\n"
+        "- Duplicate section item\n"
+        "\n"
+        "## Decisions Made\n"
+        "- Keep the CLI stateless\n"
+        "\n"
+        "## Decisions Made\n"
+        "- Trailing duplicate\n"
+    )
+
+    patterns = analyzer._parse_entry(str(entry))
+
+    assert patterns == ["Prefer small commits", "Keep the CLI stateless"]
+
+
+def test_keeps_external_appends_when_marking_processed(test_env):
+    analyzer = test_env["analyzer"]
+    diary_dir = test_env["diary_dir"]
+    reflections_dir = test_env["reflections_dir"]
+
+    processed_log = reflections_dir / "processed.log"
+    processed_log.write_text("diary-1.md\n")
+    assert len(analyzer.get_unprocessed_entries()) == 2
+
+    with open(processed_log, "a") as f:
+        f.write("diary-2.md\n")
+    stat = processed_log.stat()
+    os.utime(processed_log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    analyzer.mark_processed([str(diary_dir / "diary-3.md")])
+
+    assert analyzer.get_unprocessed_entries() == []
+
+
+def test_includes_symlinked_entries(test_env, tmp_path):
+    analyzer = test_env["analyzer"]
+    diary_dir = test_env["diary_dir"]
+
+    target = tmp_path / "elsewhere.md"
+    target.write_text("## Decisions Made\n- Keep symlinked diaries\n")
+    (diary_dir / "diary-4.md").symlink_to(target)
+
+    entries = analyzer.get_unprocessed_entries()
+
+    assert str(diary_dir / "diary-4.md") in entries
+    assert len(entries) == 4